@@ -0,0 +1,47 @@
+import os
+
+# =========================
+# CONFIG & GEMINI-CLIENT
+# =========================
+
+# Zet in Streamlit Cloud bij Settings -> Secrets:
+# GEMINI_API_KEY = "jouw_api_key"
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
+
+MODEL_NAME = "gemini-1.5-pro"
+
+_genai = None
+
+
+def get_genai():
+    """Importeer en configureer google.generativeai pas bij de eerste AI-aanroep.
+
+    De import (grpc/protobuf) is het duurste deel van een koude start, en de
+    meeste sessies openen alleen het Dashboard.
+    """
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=GEMINI_API_KEY)
+        _genai = genai
+    return _genai
+
+
+def call_gemini(system_prompt: str, user_content: str) -> str:
+    """Roep Gemini aan met een system-instructie + user-tekst."""
+    if not GEMINI_API_KEY:
+        return "⚠️ Geen GEMINI_API_KEY ingesteld. Zet deze in de Streamlit Secrets."
+
+    try:
+        model = get_genai().GenerativeModel(
+            MODEL_NAME,
+            system_instruction=system_prompt,
+        )
+        response = model.generate_content(
+            user_content,
+        )
+        return response.text or ""
+    except Exception as e:
+        # Toon de fouttekst in de app zodat we weten wat er misgaat
+        return f"⚠️ Fout bij aanroepen van Gemini: {e}"
@@ -0,0 +1,32 @@
+from datetime import datetime, date
+from typing import List, Dict, Any
+
+import streamlit as st
+
+
+# =========================
+# HULPFUNCTIES: STATE & DATA
+# =========================
+
+def init_state():
+    """Initialiseer alle state-structuren één keer."""
+    if "cars" not in st.session_state:
+        st.session_state.cars: List[Dict[str, Any]] = []
+    if "customers" not in st.session_state:
+        st.session_state.customers: List[Dict[str, Any]] = []
+    if "transporters" not in st.session_state:
+        st.session_state.transporters: List[Dict[str, Any]] = []
+    if "suppliers" not in st.session_state:
+        st.session_state.suppliers: List[Dict[str, Any]] = []
+    if "invoices" not in st.session_state:
+        st.session_state.invoices: List[Dict[str, Any]] = []
+    if "backup_json" not in st.session_state:
+        st.session_state.backup_json = ""
+
+
+def new_car_id() -> str:
+    return f"car_{int(datetime.utcnow().timestamp()*1000)}"
+
+
+def compute_stand_days(created_at: date) -> int:
+    return (date.today() - created_at).days
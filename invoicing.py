@@ -0,0 +1,308 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: alleen de thread-lock binnen het proces
+    fcntl = None
+
+import streamlit as st
+
+from relation_index import find_relation
+
+
+# =========================
+# FACTUREN
+# =========================
+
+BTW_TARIEF = 0.21
+
+# Facturen en nummering staan samen in één JSON-bestand dat door alle sessies
+# (en processen) op deze server gedeeld wordt. Zet INVOICE_STORE_PATH op een
+# persistent volume; zonder die variabele staat het bestand in de werkmap en
+# gaat het bij een herstart van de container verloren.
+INVOICE_STORE_PATH = os.environ.get("INVOICE_STORE_PATH", "invoices.json")
+INVOICE_STORE_PERSISTENT = "INVOICE_STORE_PATH" in os.environ
+
+
+def format_eur(bedrag: float) -> str:
+    """12345.6 -> '€ 12.345,60'"""
+    tekst = f"{bedrag:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+    return f"€ {tekst}"
+
+
+def compute_sale_amounts(vd: Dict[str, Any]) -> Dict[str, Any]:
+    """Splits de verkoopprijs in excl./BTW/incl. volgens BTW- of margeregeling."""
+    incl = round(float(vd.get("verkoopprijs_incl_btw", 0) or 0), 2)
+    regeling = vd.get("btw_of_marge_auto", "Onbekend")
+    if regeling == "BTW" and incl:
+        excl = round(incl / (1 + BTW_TARIEF), 2)
+        btw = round(incl - excl, 2)
+    else:
+        # Marge of onbekend: geen BTW zichtbaar op de factuur.
+        excl = incl
+        btw = 0.0
+    return {"excl": excl, "btw": btw, "incl": incl, "regeling": regeling}
+
+
+@st.cache_resource
+def _invoice_lock() -> threading.Lock:
+    """Eén lock per serverproces, gedeeld door alle Streamlit-sessies."""
+    return threading.Lock()
+
+
+def _read_store() -> Dict[str, Any]:
+    if not os.path.exists(INVOICE_STORE_PATH):
+        return {"counters": {}, "invoices": []}
+    with open(INVOICE_STORE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_store(store: Dict[str, Any]) -> None:
+    tmp_path = INVOICE_STORE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(store, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, INVOICE_STORE_PATH)
+
+
+@contextmanager
+def _store_transaction():
+    """Lees-wijzig-schrijf op de factuuropslag onder thread- én bestandslock."""
+    with _invoice_lock(), open(INVOICE_STORE_PATH + ".lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            store = _read_store()
+            yield store
+            _write_store(store)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# Per proces: laatst ingelezen opslag, met indexen op factuurnummer en car_id.
+# os.replace geeft bij elke schrijfactie een nieuw inode, dus (inode, mtime,
+# grootte) verandert alleen als er echt iets is weggeschreven.
+_store_cache: Dict[str, Any] = {"stamp": None, "invoices": [], "by_number": {}, "by_car": {}}
+
+
+def _cached_store() -> Dict[str, Any]:
+    try:
+        info = os.stat(INVOICE_STORE_PATH)
+        stamp = (info.st_ino, info.st_mtime_ns, info.st_size)
+    except FileNotFoundError:
+        stamp = None
+    if stamp != _store_cache["stamp"]:
+        invoices = _read_store()["invoices"]
+        _store_cache.update(
+            stamp=stamp,
+            invoices=invoices,
+            by_number={i["factuurnummer"]: i for i in invoices},
+            by_car={i["car_id"]: i for i in invoices},
+        )
+    return _store_cache
+
+
+def load_invoices() -> List[Dict[str, Any]]:
+    """Alle opgeslagen facturen; alleen opnieuw ingelezen na een schrijfactie. Niet wijzigen."""
+    return _cached_store()["invoices"]
+
+
+def get_invoice(factuurnummer: str) -> Optional[Dict[str, Any]]:
+    return _cached_store()["by_number"].get(factuurnummer)
+
+
+def get_invoice_for_car(car_id: str) -> Optional[Dict[str, Any]]:
+    return _cached_store()["by_car"].get(car_id)
+
+
+def store_invoices(invoices: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    """Nummer facturen (bijv. 2026-00042) en sla ze op, in één atomaire stap.
+
+    Teller en facturen worden samen weggeschreven: een nummer wordt alleen
+    verbruikt als de factuur zelf ook is opgeslagen. Concepten voor een auto die
+    al een factuur in de opslag heeft (bijv. na het terugzetten van een oude
+    backup) worden overgeslagen. Geeft de werkelijk opgeslagen facturen terug.
+    """
+    if not invoices:
+        return []
+    with _store_transaction() as store:
+        al_gefactureerd = {i["car_id"] for i in store["invoices"]}
+        nieuw = []
+        for invoice in invoices:
+            if invoice["car_id"] not in al_gefactureerd:
+                al_gefactureerd.add(invoice["car_id"])
+                nieuw.append(invoice)
+
+        first = store["counters"].get(str(year), 0) + 1
+        for n, invoice in enumerate(nieuw, start=first):
+            invoice["factuurnummer"] = f"{year}-{n:05d}"
+        store["counters"][str(year)] = first + len(nieuw) - 1
+        store["invoices"].extend(nieuw)
+    return nieuw
+
+
+def is_invoiceable(car: Dict[str, Any]) -> bool:
+    """Verkocht, met klant, verkoopprijs en bekende BTW/marge, en nog niet gefactureerd."""
+    vd = car.get("vehicle_data", {})
+    return (
+        car.get("status") == "Verkocht"
+        and not car.get("factuurnummer")
+        and bool(car.get("klant_naam"))
+        and vd.get("btw_of_marge_auto") in ("BTW", "Marge")
+        and float(vd.get("verkoopprijs_incl_btw", 0) or 0) > 0
+        and get_invoice_for_car(car["id"]) is None
+    )
+
+
+def invoiceable_cars() -> List[Dict[str, Any]]:
+    """Auto's die nu gefactureerd kunnen worden (zie is_invoiceable)."""
+    return [c for c in st.session_state.cars if is_invoiceable(c)]
+
+
+def generate_invoices(cars: List[Dict[str, Any]], factuurdatum: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Maak verkoopfacturen voor een selectie auto's.
+
+    Eerst worden alle facturen opgebouwd; pas daarna worden ze in één keer
+    genummerd en opgeslagen, zodat een fout halverwege geen gaten geeft.
+    Auto's die niet factureerbaar zijn (bijv. BTW/marge onbekend) worden geweigerd.
+    """
+    niet_factureerbaar = [c["id"] for c in cars if not is_invoiceable(c)]
+    if niet_factureerbaar:
+        raise ValueError(f"Niet factureerbaar: {', '.join(niet_factureerbaar)}")
+
+    factuurdatum = factuurdatum or date.today()
+    concepten = []
+    for car in cars:
+        vd = car.get("vehicle_data", {})
+        klant_idx = find_relation("customers", car.get("klant_naam", ""))
+        klant = st.session_state.customers[klant_idx] if klant_idx is not None else {"naam": car.get("klant_naam", "")}
+        concepten.append({
+            "car_id": car["id"],
+            "factuurdatum": factuurdatum.isoformat(),
+            "klant": {k: klant.get(k, "") for k in ("naam", "email", "plaats")},
+            "voertuig": {k: vd.get(k, "") for k in ("merk", "model", "type_of_uitvoering", "kenteken", "chassisnummer")},
+            "bedragen": compute_sale_amounts(vd),
+        })
+
+    nieuw = store_invoices(concepten, factuurdatum.year)
+    for car in cars:
+        # Ook bij een overgeslagen concept: koppel de auto aan zijn bestaande factuur.
+        invoice = get_invoice_for_car(car["id"])
+        if invoice:
+            car["factuurnummer"] = invoice["factuurnummer"]
+    st.session_state.invoices = load_invoices()
+    return nieuw
+
+
+def _pdf_text(tekst: str) -> bytes:
+    raw = tekst.encode("cp1252", errors="replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _invoice_lines(invoice: Dict[str, Any]) -> List[Tuple[int, str]]:
+    """Regels (lettergrootte, tekst) voor één factuurpagina."""
+    klant = invoice["klant"]
+    v = invoice["voertuig"]
+    b = invoice["bedragen"]
+    lines = [
+        (16, "Land Automotive B.V."),
+        (10, "Veen"),
+        (10, ""),
+        (14, "FACTUUR"),
+        (10, f"Factuurnummer: {invoice['factuurnummer']}"),
+        (10, f"Factuurdatum: {invoice['factuurdatum']}"),
+        (10, ""),
+        (10, f"Klant: {klant.get('naam', '')}"),
+        (10, f"Plaats: {klant.get('plaats', '')}"),
+        (10, f"E-mail: {klant.get('email', '')}"),
+        (10, ""),
+        (10, f"Voertuig: {v['merk']} {v['model']} {v['type_of_uitvoering']}".strip()),
+        (10, f"Kenteken: {v['kenteken']}"),
+        (10, f"Chassisnummer: {v['chassisnummer']}"),
+        (10, ""),
+    ]
+    if b["regeling"] == "BTW":
+        lines += [
+            (10, f"Bedrag excl. BTW: {format_eur(b['excl'])}"),
+            (10, f"BTW {int(BTW_TARIEF * 100)}%: {format_eur(b['btw'])}"),
+            (12, f"Totaal incl. BTW: {format_eur(b['incl'])}"),
+        ]
+    else:
+        lines += [
+            (12, f"Totaal: {format_eur(b['incl'])}"),
+            (9, "Bijzondere regeling – gebruikte goederen (margeregeling). BTW niet aftrekbaar."),
+        ]
+    return lines
+
+
+def iter_invoices_pdf(invoices: List[Dict[str, Any]]) -> Iterator[bytes]:
+    """Bouw één PDF met een pagina per factuur; de bytes komen per pagina vrij."""
+    offsets: List[Tuple[int, int]] = []
+    pos = 0
+
+    def emit(chunk: bytes) -> bytes:
+        nonlocal pos
+        pos += len(chunk)
+        return chunk
+
+    def obj(num: int, body: bytes) -> bytes:
+        offsets.append((num, pos))
+        return emit(b"%d 0 obj\n" % num + body + b"\nendobj\n")
+
+    yield emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    yield obj(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+    yield obj(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    kids = []
+    for i, invoice in enumerate(invoices):
+        page_num, content_num = 4 + 2 * i, 5 + 2 * i
+        kids.append(b"%d 0 R" % page_num)
+
+        stream = [b"BT"]
+        y = 800
+        for size, tekst in _invoice_lines(invoice):
+            stream.append(b"/F1 %d Tf 1 0 0 1 50 %d Tm (%s) Tj" % (size, y, _pdf_text(tekst)))
+            y -= size + 8
+        stream.append(b"ET")
+        content = b"\n".join(stream)
+
+        chunk = obj(page_num, (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_num
+        ))
+        chunk += obj(content_num, b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        yield chunk
+
+    yield obj(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids)))
+
+    xref_pos = pos
+    by_num = dict(offsets)
+    size = max(by_num) + 1
+    xref = [b"xref\n0 %d\n" % size, b"0000000000 65535 f \n"]
+    xref += [b"%010d 00000 n \n" % by_num[n] for n in range(1, size)]
+    xref.append(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_pos))
+    yield emit(b"".join(xref))
+
+
+def render_pdf_download(cache_key: str, invoices: List[Dict[str, Any]], file_name: str) -> None:
+    """Bouw de PDF pas na een klik en bied hem daarna als download aan."""
+    key = (cache_key, tuple(i["factuurnummer"] for i in invoices))
+    if st.button(f"PDF maken ({len(invoices)} facturen)", key=f"pdf_{cache_key}"):
+        st.session_state["invoice_pdf"] = (key, b"".join(iter_invoices_pdf(invoices)))
+
+    gebouwd = st.session_state.get("invoice_pdf")
+    if gebouwd and gebouwd[0] == key:
+        st.download_button(
+            "Download PDF",
+            data=gebouwd[1],
+            file_name=file_name,
+            mime="application/pdf",
+            key=f"download_{cache_key}",
+        )
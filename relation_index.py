@@ -0,0 +1,370 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from typing import List, Dict, Any, Optional, Tuple
+
+import streamlit as st
+
+
+# =========================
+# RELATIES (INDEX & DUBBELEN)
+# =========================
+
+RELATION_KINDS = ("customers", "transporters", "suppliers")
+
+# Rechtsvormen: zeggen niets over wie de relatie is. Lidwoorden en voegwoorden
+# ("de", "en") horen hier niet: die laten we aan de fuzzy suggesties over.
+_LEGAL_FORMS = {
+    "bv", "nv", "vof", "cv", "bvba", "sprl", "gmbh", "ag", "kg", "ohg",
+    "ltd", "llc", "inc", "sarl", "sas", "srl", "spa",
+}
+
+# Minimale gelijkenis (0..1) voor een fuzzy match op naam.
+FUZZY_CUTOFF = 0.88
+
+# Blokken van veelvoorkomende woorden ("auto", "garage", "de") bevatten bijna
+# alle relaties en worden bij fuzzy matching overgeslagen (zoals bij IDF).
+BLOCK_MAX_SHARE = 0.02
+BLOCK_MIN_SIZE = 50
+
+
+def normalize_relation_name(naam: str) -> str:
+    """Maak een vergelijkbare sleutel van een relatienaam.
+
+    Kleine letters, zonder accenten, leestekens en rechtsvorm, woorden
+    gesorteerd: "Auto Jansen B.V." en "jansen auto bv" geven dezelfde sleutel.
+    """
+    tekst = unicodedata.normalize("NFKD", naam or "")
+    tekst = "".join(ch for ch in tekst if not unicodedata.combining(ch)).lower()
+    tekst = tekst.replace(".", "").replace("'", "")
+    tokens = [t for t in re.split(r"[^a-z0-9]+", tekst) if t and t not in _LEGAL_FORMS]
+    return " ".join(sorted(tokens))
+
+
+def _blocking_keys(key: str) -> set:
+    """Blokken voor fuzzy matching: alleen kandidaten met een gedeeld blok worden vergeleken."""
+    return {t[:3] for t in key.split() if len(t) >= 2}
+
+
+def _relation_names(entry: Dict[str, Any]) -> List[str]:
+    return [entry.get("naam", "")] + list(entry.get("aliassen", []))
+
+
+def _index_entry(index: Dict[str, Any], idx: int, entry: Dict[str, Any]) -> None:
+    keys = index["keys"].setdefault(idx, [])
+    for naam in _relation_names(entry):
+        key = normalize_relation_name(naam)
+        if not key or key in keys:
+            continue
+        keys.append(key)
+        index["exact"].setdefault(key, idx)
+        for bk in _blocking_keys(key):
+            index["blocks"].setdefault(bk, set()).add(idx)
+        tokens = index["tokens"]
+        for token in key.split():
+            pos = bisect_left(tokens, (token, idx))
+            if pos == len(tokens) or tokens[pos] != (token, idx):
+                tokens.insert(pos, (token, idx))
+
+
+def build_relation_index(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Bouw exacte, blok- en prefixindex over een lijst relaties."""
+    index = {"src_id": id(entries), "n": 0, "exact": {}, "keys": {}, "blocks": {}, "tokens": []}
+    for i, entry in enumerate(entries):
+        _index_entry(index, i, entry)
+    index["n"] = len(entries)
+    return index
+
+
+def get_relation_index(kind: str) -> Dict[str, Any]:
+    """Geef de index voor customers/transporters/suppliers; bouw opnieuw als de lijst is vervangen."""
+    entries = st.session_state[kind]
+    indexes = st.session_state.setdefault("relation_index", {})
+    index = indexes.get(kind)
+    if index is None or index["src_id"] != id(entries) or index["n"] != len(entries):
+        index = build_relation_index(entries)
+        indexes[kind] = index
+    return index
+
+
+def _fuzzy_matches(index: Dict[str, Any], key: str,
+                   cutoff: float = FUZZY_CUTOFF) -> List[Tuple[int, float]]:
+    """Kandidaten uit dezelfde (niet te grote) blokken met gelijkenis >= cutoff, beste eerst."""
+    max_block = max(BLOCK_MIN_SIZE, int(len(index["keys"]) * BLOCK_MAX_SHARE))
+    kandidaten = set()
+    for bk in _blocking_keys(key):
+        block = index["blocks"].get(bk, set())
+        if len(block) <= max_block:
+            kandidaten |= block
+
+    # SequenceMatcher cachet de analyse van seq2; die is voor alle kandidaten gelijk.
+    matcher = SequenceMatcher(None)
+    matcher.set_seq2(key)
+    lengte = len(key)
+    scores: Dict[int, float] = {}
+    for idx in kandidaten:
+        for other in index["keys"][idx]:
+            # Bovengrens van ratio() op basis van alleen de lengtes.
+            if 2 * min(lengte, len(other)) < cutoff * (lengte + len(other)):
+                continue
+            matcher.set_seq1(other)
+            if matcher.quick_ratio() < cutoff:
+                continue
+            score = matcher.ratio()
+            if score >= cutoff and score > scores.get(idx, 0):
+                scores[idx] = score
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def find_relation(kind: str, naam: str) -> Optional[int]:
+    """Zoek de positie van een bestaande relatie met exact dezelfde genormaliseerde naam."""
+    key = normalize_relation_name(naam)
+    if not key:
+        return None
+    return get_relation_index(kind)["exact"].get(key)
+
+
+def suggest_relations(kind: str, naam: str, limit: int = 3) -> List[Dict[str, Any]]:
+    """Relaties met een sterk gelijkende (maar niet gelijke) naam, voor "Bedoelde je …?"."""
+    key = normalize_relation_name(naam)
+    if not key:
+        return []
+    entries = st.session_state[kind]
+    index = get_relation_index(kind)
+    exact = index["exact"].get(key)
+    return [
+        entries[idx] for idx, _ in _fuzzy_matches(index, key)
+        if idx != exact
+    ][:limit]
+
+
+def typeahead_relations(kind: str, query: str, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+    """Relaties waarvan elk woord uit de zoekterm het begin van een woord in de naam is."""
+    entries = st.session_state[kind]
+    q_tokens = normalize_relation_name(query).split()
+    if not q_tokens:
+        return list(entries[:limit])
+
+    tokens = get_relation_index(kind)["tokens"]
+    gevonden = None
+    for q in q_tokens:
+        matches = set()
+        pos = bisect_left(tokens, (q, -1))
+        while pos < len(tokens) and tokens[pos][0].startswith(q):
+            matches.add(tokens[pos][1])
+            pos += 1
+        gevonden = matches if gevonden is None else gevonden & matches
+        if not gevonden:
+            return []
+    return [entries[i] for i in sorted(gevonden)[:limit]]
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    return str(a).strip().lower() == str(b).strip().lower()
+
+
+def merge_relation(target: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Voeg other samen in target zonder gegevens te verliezen.
+
+    Lege velden van target worden aangevuld; afwijkende waarden blijven bewaard
+    onder "conflicten" en worden teruggegeven, zodat de gebruiker ze kan nakijken.
+    Afwijkende namen worden als alias bewaard.
+    """
+    conflicten: Dict[str, List[Any]] = {}
+    inkomend = [(veld, waarde) for veld, waarde in other.items()
+                if veld not in ("naam", "aliassen", "conflicten")]
+    for veld, waarden in other.get("conflicten", {}).items():
+        inkomend += [(veld, w) for w in waarden]
+
+    for veld, waarde in inkomend:
+        if not waarde:
+            continue
+        if not target.get(veld):
+            target[veld] = waarde
+        elif not _same_value(target[veld], waarde):
+            bekend = target.setdefault("conflicten", {}).setdefault(veld, [])
+            if not any(_same_value(w, waarde) for w in bekend):
+                bekend.append(waarde)
+                conflicten.setdefault(veld, []).append(waarde)
+
+    bekend_namen = {normalize_relation_name(n) for n in _relation_names(target)}
+    for naam in _relation_names(other):
+        key = normalize_relation_name(naam)
+        if key and key not in bekend_namen:
+            target.setdefault("aliassen", []).append(naam)
+            bekend_namen.add(key)
+    return conflicten
+
+
+def add_relation(kind: str, entry: Dict[str, Any]) -> Tuple[int, bool, Dict[str, List[Any]]]:
+    """Voeg een relatie toe; bij exact dezelfde genormaliseerde naam wordt samengevoegd.
+
+    Gelijkende namen worden nooit automatisch samengevoegd (zie suggest_relations
+    en de dubbelen-controle). Geeft (positie, nieuw_aangemaakt, conflicten) terug.
+    """
+    entries = st.session_state[kind]
+    idx = find_relation(kind, entry.get("naam", ""))
+    index = get_relation_index(kind)
+    if idx is not None:
+        conflicten = merge_relation(entries[idx], entry)
+        _index_entry(index, idx, entries[idx])
+        return idx, False, conflicten
+
+    entries.append(entry)
+    _index_entry(index, len(entries) - 1, entry)
+    index["n"] = len(entries)
+    return len(entries) - 1, True, {}
+
+
+def find_duplicate_candidates(kind: str) -> List[Tuple[int, int, float]]:
+    """Paren (i, j, gelijkenis) met i < j die waarschijnlijk dezelfde relatie zijn."""
+    index = get_relation_index(kind)
+    paren: Dict[Tuple[int, int], float] = {}
+    for i, keys in index["keys"].items():
+        for key in keys:
+            for j, score in _fuzzy_matches(index, key):
+                if j > i and score > paren.get((i, j), 0):
+                    paren[(i, j)] = score
+    return sorted(((i, j, score) for (i, j), score in paren.items()),
+                  key=lambda p: (-p[2], p[0], p[1]))
+
+
+def merge_relations(kind: str, paren: List[Tuple[int, int]]) -> int:
+    """Voeg de bevestigde paren samen (j gaat op in i). Geeft het aantal verwijderde entries terug."""
+    entries = st.session_state[kind]
+    root = list(range(len(entries)))
+
+    def find(i: int) -> int:
+        while root[i] != i:
+            root[i] = root[root[i]]
+            i = root[i]
+        return i
+
+    for i, j in paren:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            root[max(ri, rj)] = min(ri, rj)
+
+    merged = {i: dict(entries[i]) for i in range(len(entries)) if find(i) == i}
+    for i, entry in enumerate(entries):
+        if find(i) != i:
+            merge_relation(merged[find(i)], entry)
+
+    st.session_state[kind] = [merged[i] for i in sorted(merged)]
+    return len(entries) - len(merged)
+
+
+def extract_ai_field(ai_output: str, field: str) -> str:
+    """Haal één veld (bijv. leverancier_naam) uit de ruwe AI-output."""
+    match = re.search(
+        rf'{re.escape(field)}["* \t]*[:=][ \t*]*(?:"([^"\n]*)"|([^\n]*))',
+        ai_output or "",
+    )
+    if not match:
+        return ""
+    if match.group(1) is not None:
+        waarde = match.group(1)
+    else:
+        # Zonder aanhalingstekens: tot het einde van de regel, alleen een afsluitende `",` eraf.
+        waarde = match.group(2).strip()
+        waarde = waarde[:-1] if waarde.endswith(",") else waarde
+        waarde = waarde[:-1] if waarde.endswith('"') else waarde
+    waarde = waarde.strip()
+    return "" if waarde.lower() in ("null", "none", "-") else waarde
+
+
+def link_supplier(vd: Dict[str, Any], ai_output: str) -> Optional[Dict[str, Any]]:
+    """Koppel de leverancier uit de AI-output aan een leverancier met dezelfde naam.
+
+    Alleen een exacte (genormaliseerde) match wordt gekoppeld; anders komt er een
+    nieuwe leverancier bij en worden gelijkende namen als suggestie teruggegeven.
+    """
+    naam = extract_ai_field(ai_output, "leverancier_naam")
+    if not naam:
+        return None
+    vd["leverancier_naam"] = naam
+    entry = {"naam": naam, "plaats": extract_ai_field(ai_output, "leverancier_plaats")}
+    suggesties = [] if find_relation("suppliers", naam) is not None else suggest_relations("suppliers", naam)
+    idx, created, conflicten = add_relation("suppliers", entry)
+    return {
+        "supplier": st.session_state.suppliers[idx],
+        "created": created,
+        "conflicten": conflicten,
+        "suggesties": suggesties,
+    }
+
+
+def format_conflicts(conflicten: Dict[str, List[Any]]) -> str:
+    return "; ".join(f"{veld}: {', '.join(map(str, waarden))}" for veld, waarden in conflicten.items())
+
+
+def report_added_relation(kind: str, label: str, naam: str,
+                          result: Tuple[int, bool, Dict[str, List[Any]]]) -> None:
+    """Meld het resultaat van add_relation, met conflicten en "Bedoelde je …?"."""
+    idx, created, conflicten = result
+    if created:
+        st.success(f"{label} toegevoegd.")
+        suggesties = [e for e in suggest_relations(kind, naam) if e is not st.session_state[kind][idx]]
+        if suggesties:
+            namen = ", ".join(e["naam"] for e in suggesties)
+            st.info(f"Bedoelde je {namen}? Voeg dubbele vermeldingen samen via 'Zoek dubbele vermeldingen'.")
+    else:
+        st.info(f"{label} bestond al; gegevens zijn samengevoegd.")
+    if conflicten:
+        st.warning(f"Afwijkende gegevens bewaard als conflict: {format_conflicts(conflicten)}")
+
+
+def render_relation_list(kind: str, titel: str, fmt, key_prefix: str, limit: int = 50) -> None:
+    """Toon bestaande relaties met typeahead-zoekveld en dubbelen-controle."""
+    entries = st.session_state[kind]
+    if not entries:
+        return
+
+    st.write(f"### {titel}")
+    melding = st.session_state.pop(f"{key_prefix}_melding", None)
+    if melding:
+        st.success(melding)
+    zoek = st.text_input("Zoeken", key=f"{key_prefix}_zoek")
+    gevonden = typeahead_relations(kind, zoek, limit=None)
+    for entry in gevonden[:limit]:
+        st.write(fmt(entry))
+        if entry.get("conflicten"):
+            st.caption(f"⚠️ Afwijkende gegevens: {format_conflicts(entry['conflicten'])}")
+    if len(gevonden) > limit:
+        st.caption(f"{limit} van {len(gevonden)} getoond – verfijn de zoekterm.")
+
+    state_key = f"{key_prefix}_dubbelen"
+    if st.button("Zoek dubbele vermeldingen", key=f"{key_prefix}_dedupe"):
+        st.session_state[state_key] = {
+            "src_id": id(entries),
+            "n": len(entries),
+            "paren": find_duplicate_candidates(kind),
+        }
+
+    kandidaten = st.session_state.get(state_key)
+    if not kandidaten:
+        return
+    if kandidaten["src_id"] != id(entries) or kandidaten["n"] != len(entries):
+        # Lijst is intussen gewijzigd; posities kloppen niet meer.
+        del st.session_state[state_key]
+        return
+    if not kandidaten["paren"]:
+        st.info("Geen dubbele vermeldingen gevonden.")
+        return
+
+    st.write("Kies welke paren samengevoegd moeten worden:")
+    gekozen = []
+    for i, j, score in kandidaten["paren"]:
+        if st.checkbox(
+            f"{entries[i]['naam']} ↔ {entries[j]['naam']} ({score:.0%})",
+            value=score == 1.0,
+            key=f"{key_prefix}_paar_{i}_{j}",
+        ):
+            gekozen.append((i, j))
+
+    if st.button("Geselecteerde samenvoegen", key=f"{key_prefix}_merge", disabled=not gekozen):
+        removed = merge_relations(kind, gekozen)
+        del st.session_state[state_key]
+        st.session_state[f"{key_prefix}_melding"] = f"{removed} dubbele vermelding(en) samengevoegd."
+        st.rerun()
@@ -0,0 +1,40 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+# =========================
+# OPSTARTTIMER
+# =========================
+
+# Wordt één keer per serverproces gezet: de eerste import gebeurt bij de
+# eerste run van app.py, latere reruns gebruiken de module uit sys.modules.
+PROCESS_START = time.perf_counter()
+
+# Label -> duur in milliseconden (per proces).
+TIMINGS: Dict[str, float] = {}
+
+logger = logging.getLogger("land_automotive.timing")
+
+
+def mark_once(label: str) -> None:
+    """Leg de tijd sinds de processtart vast, alleen de eerste keer voor dit label.
+
+    Alleen zinvol voor momenten direct na de start (de eerste weergave); voor
+    latere momenten telt de tijd die de gebruiker op andere pagina's doorbracht mee.
+    """
+    if label not in TIMINGS:
+        TIMINGS[label] = (time.perf_counter() - PROCESS_START) * 1000
+        logger.info("%s na %.0f ms", label, TIMINGS[label])
+
+
+@contextmanager
+def timed(label: str):
+    """Meet de duur van een blok (bijv. het laden van een pagina), alleen de eerste keer."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if label not in TIMINGS:
+            TIMINGS[label] = (time.perf_counter() - start) * 1000
+            logger.info("%s: %.0f ms", label, TIMINGS[label])
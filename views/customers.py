@@ -0,0 +1,24 @@
+import streamlit as st
+
+from relation_index import add_relation, render_relation_list, report_added_relation
+
+
+def page_customers():
+    st.header("Klanten (basis CRM)")
+
+    with st.form("add_customer"):
+        st.subheader("Nieuwe klant toevoegen")
+        naam = st.text_input("Bedrijfsnaam / klantnaam")
+        email = st.text_input("E-mailadres")
+        plaats = st.text_input("Plaats")
+        submit = st.form_submit_button("Opslaan")
+    if submit and naam:
+        result = add_relation("customers", {"naam": naam, "email": email, "plaats": plaats})
+        report_added_relation("customers", "Klant", naam, result)
+
+    render_relation_list(
+        "customers",
+        "Bestaande klanten",
+        lambda c: f"- **{c['naam']}** ({c.get('plaats','')}) – {c.get('email','')}",
+        "cust",
+    )
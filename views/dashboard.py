@@ -0,0 +1,47 @@
+from datetime import date
+
+import streamlit as st
+
+from core import compute_stand_days
+
+
+def page_dashboard():
+    st.header("Dashboard – Overzicht voertuigen")
+
+    if not st.session_state.cars:
+        st.info("Er zijn nog geen voertuigen. Kies in de sidebar 'Nieuwe auto' om te starten.")
+        return
+
+    search = st.text_input("Zoek op merk, model, kenteken of chassisnummer")
+    filtered = []
+    for car in st.session_state.cars:
+        text = " ".join(
+            str(car.get("vehicle_data", {}).get(k, "")) for k in
+            ["merk", "model", "kenteken", "chassisnummer"]
+        ).lower()
+        if not search or search.lower() in text:
+            filtered.append(car)
+
+    for car in filtered:
+        vd = car.get("vehicle_data", {})
+        merk = vd.get("merk", "Onbekend")
+        model = vd.get("model", "")
+        kenteken = vd.get("kenteken", "")
+        status = car.get("status", "Te koop")
+        verkoopprijs = vd.get("verkoopprijs_incl_btw", None)
+        created_at = car.get("created_at_date", date.today())
+        stadagen = compute_stand_days(created_at)
+
+        with st.container(border=True):
+            st.subheader(f"{merk} {model} {('– '+kenteken) if kenteken else ''}")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.write(f"**Status:** {status}")
+                st.write(f"**Stadagen:** {stadagen}")
+            with col2:
+                if verkoopprijs is not None:
+                    st.write(f"**Verkoopprijs (incl. BTW):** € {verkoopprijs:,.0f}".replace(",", "."))
+            with col3:
+                if st.button("Open dossier", key=f"open_{car['id']}"):
+                    st.session_state["active_car_id"] = car["id"]
+                    st.session_state["active_page"] = "Dossier"
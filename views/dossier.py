@@ -0,0 +1,301 @@
+from typing import List, Dict, Any, Optional
+
+import streamlit as st
+
+from ai import call_gemini
+from invoicing import (
+    BTW_TARIEF,
+    compute_sale_amounts,
+    format_eur,
+    generate_invoices,
+    get_invoice,
+    get_invoice_for_car,
+    render_pdf_download,
+)
+from prompts import SYSTEM_PROMPT
+
+
+def get_active_car() -> Optional[Dict[str, Any]]:
+    car_id = st.session_state.get("active_car_id")
+    if not car_id:
+        return None
+    for c in st.session_state.cars:
+        if c["id"] == car_id:
+            return c
+    return None
+
+
+def page_dossier():
+    car = get_active_car()
+    if not car:
+        st.info("Geen actief dossier. Ga naar het Dashboard en kies een voertuig.")
+        return
+
+    vd = car.setdefault("vehicle_data", {})
+
+    st.header("Voertuigdossier")
+
+    tabs = st.tabs(["Gegevens", "Taken", "Kosten", "Inspectie", "Label", "Factuur (basis)"])
+
+    # ---- Gegevens-tab ----
+    with tabs[0]:
+        st.subheader("Gegevens – voertuig & financieel")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            vd["merk"] = st.text_input("Merk", vd.get("merk", ""))
+            vd["model"] = st.text_input("Model", vd.get("model", ""))
+            vd["type_of_uitvoering"] = st.text_input("Type/uitvoering", vd.get("type_of_uitvoering", ""))
+            vd["kenteken"] = st.text_input("Kenteken", vd.get("kenteken", ""))
+            vd["chassisnummer"] = st.text_input("Chassisnummer (VIN)", vd.get("chassisnummer", ""))
+
+        with col2:
+            vd["brandstof"] = st.text_input("Brandstof", vd.get("brandstof", ""))
+            vd["transmissie"] = st.text_input("Transmissie", vd.get("transmissie", ""))
+            vd["kleur"] = st.text_input("Kleur", vd.get("kleur", ""))
+            vd["meldcode"] = st.text_input("Meldcode", vd.get("meldcode", ""))
+            datum_1 = st.text_input("Datum deel 1", vd.get("datum_eerste_toelating", ""))
+
+        with col3:
+            vd["inkoopprijs_excl_btw"] = st.number_input(
+                "Inkoopprijs excl. BTW",
+                value=float(vd.get("inkoopprijs_excl_btw", 0) or 0),
+                step=100.0,
+            )
+            vd["bpm_bedrag"] = st.number_input(
+                "BPM bedrag",
+                value=float(vd.get("bpm_bedrag", 0) or 0),
+                step=100.0,
+            )
+            vd["verkoopprijs_incl_btw"] = st.number_input(
+                "Verkoopprijs incl. BTW",
+                value=float(vd.get("verkoopprijs_incl_btw", 0) or 0),
+                step=100.0,
+            )
+            vd["btw_of_marge_auto"] = st.selectbox(
+                "BTW of Marge auto",
+                ["Onbekend", "BTW", "Marge"],
+                index=["Onbekend", "BTW", "Marge"].index(vd.get("btw_of_marge_auto", "Onbekend"))
+            )
+
+        if datum_1:
+            vd["datum_eerste_toelating"] = datum_1
+
+        statussen = ["Te koop", "Gereserveerd", "Verkocht"]
+        car["status"] = st.selectbox(
+            "Status",
+            statussen,
+            index=statussen.index(car["status"]) if car.get("status") in statussen else 0,
+        )
+
+        st.success("Gegevens worden automatisch in het dossier opgeslagen.")
+
+    # ---- Taken-tab ----
+    with tabs[1]:
+        st.subheader("Taken")
+
+        tasks: List[Dict[str, Any]] = car.setdefault("tasks", [])
+
+        if not tasks:
+            st.info("Nog geen taken gegenereerd. Klik hieronder om op basis van voertuiggegevens taken aan te maken.")
+            if st.button("Genereer standaard taken"):
+                brandstof = vd.get("brandstof", "").lower()
+                new_tasks = []
+
+                def add_task(id_, naam, omschrijving, categorie, prioriteit="midden"):
+                    new_tasks.append({
+                        "taak_id": id_,
+                        "taak_naam": naam,
+                        "omschrijving": omschrijving,
+                        "categorie": categorie,
+                        "prioriteit": prioriteit,
+                        "status": "open",
+                        "automatisch_gegenereerd": True,
+                    })
+
+                # Altijd
+                add_task("transport_plannen", "Transport plannen", "Plan transport vanaf leverancier naar Land Automotive.", "logistiek", "hoog")
+                add_task("online_zetten", "Online zetten", "Zet het voertuig online in Mobilox/website.", "verkoopvoorbereiding", "hoog")
+                add_task("check_extra_werk", "Extra werk checken", "Controleer cosmetisch/technisch werk en poetsen.", "techniek", "midden")
+
+                # Brandstof-specifiek
+                if "phev" in brandstof or "plug" in brandstof:
+                    add_task("bpm_rapport_maken", "BPM-rapport maken", "Maak een BPM-rapport voor deze PHEV.", "administratie", "midden")
+                elif "ev" in brandstof or "elektrisch" in brandstof:
+                    add_task("actieradius_testen", "Actieradius testen", "Test globaal de actieradius van de EV.", "techniek", "laag")
+                elif "benzine" in brandstof or "diesel" in brandstof:
+                    add_task("taxatie_inplannen", "Taxatie inplannen", "Plan een taxatie in voor deze brandstofauto.", "administratie", "midden")
+
+                car["tasks"] = new_tasks
+                st.experimental_rerun()
+        else:
+            for i, t in enumerate(tasks):
+                cols = st.columns([3, 2, 2, 2])
+                with cols[0]:
+                    st.write(f"**{t['taak_naam']}**")
+                    st.caption(t["omschrijving"])
+                with cols[1]:
+                    t["status"] = st.selectbox(
+                        "Status",
+                        ["open", "bezig", "afgerond"],
+                        index=["open", "bezig", "afgerond"].index(t.get("status", "open")),
+                        key=f"status_{car['id']}_{i}",
+                    )
+                with cols[2]:
+                    t["prioriteit"] = st.selectbox(
+                        "Prioriteit",
+                        ["hoog", "midden", "laag"],
+                        index=["hoog", "midden", "laag"].index(t.get("prioriteit", "midden")),
+                        key=f"prio_{car['id']}_{i}",
+                    )
+                with cols[3]:
+                    st.write(t.get("categorie", ""))
+
+    # ---- Kosten-tab (basis) ----
+    with tabs[2]:
+        st.subheader("Kosten & resultaat (basis)")
+
+        costs: List[Dict[str, Any]] = car.setdefault("costs", [])
+
+        with st.form("add_cost"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                oms = st.text_input("Omschrijving", "")
+            with col2:
+                bedrag = st.number_input("Bedrag", min_value=0.0, step=50.0)
+            with col3:
+                incl_btw = st.selectbox("Bedrag incl. of excl. BTW?", ["incl", "excl"])
+            submitted = st.form_submit_button("Kostenregel toevoegen")
+
+        if submitted and oms and bedrag > 0:
+            costs.append({
+                "omschrijving": oms,
+                "bedrag": bedrag,
+                "incl_of_excl": incl_btw,
+            })
+            st.success("Kostenregel toegevoegd.")
+            st.experimental_rerun()
+
+        if costs:
+            st.write("### Kosten")
+            for c in costs:
+                st.write(f"- {c['omschrijving']}: € {c['bedrag']:,.0f} ({c['incl_of_excl']})".replace(",", "."))
+
+        inkoop = float(vd.get("inkoopprijs_excl_btw", 0) or 0)
+        bpm = float(vd.get("bpm_bedrag", 0) or 0)
+
+        # Uitgaan van 21% BTW indien BTW-auto; bij marge of onbekend simpel benaderd
+        verkoop_excl = compute_sale_amounts(vd)["excl"]
+
+        totale_kosten = sum(c["bedrag"] for c in costs)
+        resultaat = verkoop_excl - inkoop - bpm - totale_kosten
+
+        st.markdown("---")
+        st.write(f"**Inkoop excl. BTW:** € {inkoop:,.0f}".replace(",", "."))
+        st.write(f"**BPM:** € {bpm:,.0f}".replace(",", "."))
+        st.write(f"**Totale kosten (extra):** € {totale_kosten:,.0f}".replace(",", "."))
+        st.write(f"**Verkoop (netto benadering):** € {verkoop_excl:,.0f}".replace(",", "."))
+        st.success(f"**Indicatief resultaat:** € {resultaat:,.0f}".replace(",", "."))
+
+    # ---- Inspectie-tab (placeholder) ----
+    with tabs[3]:
+        st.subheader("Inspectie (basisversie)")
+        st.info("Hier kun je later inspectietekst en foto's toevoegen. De AI kan dan een inspectierapport maken.")
+        inspectietekst = st.text_area("Inspectie / schades (tekst)", car.get("inspectietekst", ""), height=200)
+        if st.button("Genereer inspectierapport (AI)"):
+            with st.spinner("Rapport wordt gemaakt…"):
+                tekst = f"INSPECTIE-INFORMATIE:\n{inspectietekst}\n\nAUTO:\n{vd}"
+                insp_output = call_gemini(SYSTEM_PROMPT, tekst)
+            car["inspectierapport_ai"] = insp_output
+            st.success("Inspectierapport gegenereerd.")
+            st.markdown("### Inspectierapport (AI)")
+            st.code(insp_output)
+        car["inspectietekst"] = inspectietekst
+
+        if "inspectierapport_ai" in car:
+            st.markdown("### Laatste inspectierapport")
+            st.code(car["inspectierapport_ai"])
+
+    # ---- Label-tab ----
+    with tabs[4]:
+        st.subheader("Label voor sleutellabel")
+
+        merk = vd.get("merk", "")
+        model = vd.get("model", "")
+        uitvoer = vd.get("type_of_uitvoering", "")
+        kenteken = vd.get("kenteken", "")
+        chassis = vd.get("chassisnummer", "")
+        kleur = vd.get("kleur", "")
+        brandstof = vd.get("brandstof", "")
+
+        # Kenteken of laatste 4 van VIN
+        if kenteken:
+            regel3 = kenteken
+        else:
+            regel3 = chassis[-4:] if chassis else ""
+
+        regel1 = "Land Automotive"
+        regel2 = f"{merk} {model} {uitvoer}".strip()
+        regel4 = f"{kleur} {(' '+brandstof) if brandstof else ''}".strip()
+
+        st.text_input("Regel 1", value=regel1)
+        st.text_input("Regel 2", value=regel2)
+        st.text_input("Regel 3", value=regel3)
+        st.text_input("Regel 4", value=regel4)
+
+        st.info("In een latere versie kunnen we hier een echte printlayout / PDF voor een labelprinter van maken.")
+
+    # ---- Factuur-tab ----
+    with tabs[5]:
+        st.subheader("Verkoopfactuur")
+
+        invoice = (
+            get_invoice(car["factuurnummer"]) if car.get("factuurnummer")
+            else get_invoice_for_car(car["id"])
+        )
+        if invoice or car.get("factuurnummer"):
+            car["factuurnummer"] = car.get("factuurnummer") or invoice["factuurnummer"]
+            st.success(f"Gefactureerd met factuurnummer {car['factuurnummer']}.")
+            if invoice:
+                render_pdf_download(
+                    f"factuur_{invoice['factuurnummer']}",
+                    [invoice],
+                    f"factuur_{invoice['factuurnummer']}.pdf",
+                )
+        else:
+            klantnamen = [c["naam"] for c in st.session_state.customers]
+            if not klantnamen:
+                st.info("Voeg eerst een klant toe onder 'Klanten'.")
+            else:
+                # Geen standaardkeuze: alleen een bewuste keuze wordt in de auto opgeslagen.
+                huidige = car.get("klant_naam")
+                gekozen_klant = st.selectbox(
+                    "Klant",
+                    klantnamen,
+                    index=klantnamen.index(huidige) if huidige in klantnamen else None,
+                    placeholder="— kies klant —",
+                    key=f"klant_{car['id']}",
+                )
+                if gekozen_klant:
+                    car["klant_naam"] = gekozen_klant
+
+            bedragen = compute_sale_amounts(vd)
+            if bedragen["regeling"] == "BTW":
+                st.write(f"**Excl. BTW:** {format_eur(bedragen['excl'])}")
+                st.write(f"**BTW {int(BTW_TARIEF * 100)}%:** {format_eur(bedragen['btw'])}")
+            elif bedragen["regeling"] == "Marge":
+                st.write("**Margeregeling** – geen BTW op de factuur.")
+            st.write(f"**Totaal:** {format_eur(bedragen['incl'])}")
+
+            if car.get("status") != "Verkocht":
+                st.info("Zet de status op 'Verkocht' (tab Gegevens) om te kunnen factureren.")
+            elif not bedragen["incl"]:
+                st.warning("Vul eerst een verkoopprijs in.")
+            elif bedragen["regeling"] not in ("BTW", "Marge"):
+                st.warning("Kies eerst BTW of Marge (tab Gegevens).")
+            elif not car.get("klant_naam"):
+                st.info("Kies eerst een klant.")
+            elif st.button("Factuur aanmaken"):
+                generate_invoices([car])
+                st.rerun()
@@ -0,0 +1,65 @@
+from datetime import date
+
+import streamlit as st
+
+from invoicing import (
+    INVOICE_STORE_PATH,
+    INVOICE_STORE_PERSISTENT,
+    format_eur,
+    generate_invoices,
+    invoiceable_cars,
+    load_invoices,
+    render_pdf_download,
+)
+
+
+def page_invoices():
+    st.header("Facturen (overzicht)")
+
+    if not INVOICE_STORE_PERSISTENT:
+        st.warning(
+            f"INVOICE_STORE_PATH is niet ingesteld: facturen en nummering staan in "
+            f"'{INVOICE_STORE_PATH}' in de werkmap en gaan verloren bij een herstart."
+        )
+
+    st.subheader("Facturen genereren")
+    kandidaten = invoiceable_cars()
+    if not kandidaten:
+        st.info("Geen verkochte auto's met klant en verkoopprijs die nog gefactureerd moeten worden.")
+    else:
+        labels = {
+            c["id"]: f"{c['vehicle_data'].get('merk', '')} {c['vehicle_data'].get('model', '')} – {c['klant_naam']}"
+            for c in kandidaten
+        }
+        gekozen = st.multiselect(
+            "Te factureren auto's",
+            list(labels),
+            default=list(labels),
+            format_func=labels.get,
+        )
+        factuurdatum = st.date_input("Factuurdatum", value=date.today())
+        if gekozen and st.button(f"Genereer {len(gekozen)} facturen"):
+            selectie = [c for c in kandidaten if c["id"] in gekozen]
+            nieuw = generate_invoices(selectie, factuurdatum)
+            if nieuw:
+                st.success(f"{len(nieuw)} facturen aangemaakt ({nieuw[0]['factuurnummer']} t/m {nieuw[-1]['factuurnummer']}).")
+            if len(nieuw) < len(selectie):
+                st.info(f"{len(selectie) - len(nieuw)} auto('s) hadden al een factuur en zijn overgeslagen.")
+
+    # De factuuropslag is leidend; de sessie houdt een kopie voor de backup.
+    invoices = st.session_state.invoices = load_invoices()
+    if not invoices:
+        return
+
+    st.subheader("Bestaande facturen")
+    maanden = sorted({i["factuurdatum"][:7] for i in invoices}, reverse=True)
+    maand = st.selectbox("Maand", maanden)
+    van_maand = [i for i in invoices if i["factuurdatum"].startswith(maand)]
+
+    for i in van_maand:
+        st.write(
+            f"- **{i['factuurnummer']}** ({i['factuurdatum']}) – {i['klant']['naam']} – "
+            f"{i['voertuig']['merk']} {i['voertuig']['model']} – {format_eur(i['bedragen']['incl'])}"
+        )
+
+    render_pdf_download(f"maand_{maand}", van_maand, f"facturen_{maand}.pdf")
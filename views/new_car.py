@@ -0,0 +1,71 @@
+from datetime import datetime, date
+from typing import Dict, Any
+
+import streamlit as st
+
+from ai import call_gemini
+from core import new_car_id
+from prompts import SYSTEM_PROMPT
+from relation_index import format_conflicts, link_supplier
+
+
+def page_new_car():
+    st.header("Nieuwe auto – Inkoopfactuur inlezen")
+
+    st.write("Sleep hier je inkoopfactuur (PDF/JPG/PNG) of plak tekst.")
+    uploaded = st.file_uploader("Inkoopfactuur (PDF/beeld)", type=["pdf", "jpg", "jpeg", "png"])
+    ocr_text = st.text_area("Of plak hier de tekst van de factuur/advertentie", height=200)
+    extra_context = st.text_area(
+        "Extra info (bijv. waar de auto staat, bijzonderheden, klant, interne notities)",
+        height=120,
+    )
+
+    if st.button("Verwerk met AI"):
+        if not uploaded and not ocr_text:
+            st.warning("Upload een factuur of plak tekst voordat je op 'Verwerk met AI' klikt.")
+            return
+
+        with st.spinner("Factuur wordt verwerkt door AI…"):
+            # In deze eerste versie gebruiken we alleen de tekst.
+            # Later kun je hier OCR toevoegen voor PDF/beelden.
+            base_text = ocr_text or ""
+            if uploaded:
+                base_text += f"\n[BESTANDSNAAM: {uploaded.name}]"
+
+            ai_output = call_gemini(SYSTEM_PROMPT, base_text)
+
+        # Sla ruwe AI-output op in de car – de app kan dit later verder parsen/splitsen.
+        vehicle_data: Dict[str, Any] = {}
+        supplier_link = link_supplier(vehicle_data, ai_output)
+        car = {
+            "id": new_car_id(),
+            "created_at": datetime.utcnow().isoformat(),
+            "created_at_date": date.today(),
+            "raw_ai_output": ai_output,
+            "vehicle_data": vehicle_data,   # verder te vullen uit ai_output
+            "tasks": [],
+            "costs": [],
+            "notes": extra_context,
+            "status": "Te koop",
+        }
+        st.session_state.cars.append(car)
+        st.session_state["active_car_id"] = car["id"]
+        st.session_state["active_page"] = "Dossier"
+
+        st.success("Auto aangemaakt op basis van de factuur. Ga verder in het dossier.")
+        if supplier_link:
+            supplier = supplier_link["supplier"]
+            if supplier_link["created"]:
+                st.info(f"Nieuwe leverancier aangemaakt: {supplier['naam']}")
+            else:
+                st.info(f"Gekoppeld aan bestaande leverancier: {supplier['naam']}")
+            if supplier_link["suggesties"]:
+                namen = ", ".join(s["naam"] for s in supplier_link["suggesties"])
+                st.info(f"Bedoelde je {namen}? Voeg samen via Relaties → 'Zoek dubbele vermeldingen'.")
+            if supplier_link["conflicten"]:
+                st.warning(
+                    "Afwijkende leveranciersgegevens bewaard als conflict: "
+                    f"{format_conflicts(supplier_link['conflicten'])}"
+                )
+        st.markdown("### AI-output (debug / controle)")
+        st.code(ai_output)
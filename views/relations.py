@@ -0,0 +1,44 @@
+import streamlit as st
+
+from relation_index import add_relation, render_relation_list, report_added_relation
+
+
+def page_relations():
+    st.header("Relaties – Transporteurs & Leveranciers")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Transporteurs")
+        with st.form("add_transporter"):
+            naam = st.text_input("Naam transporteur")
+            email = st.text_input("E-mailadres transporteur")
+            tel = st.text_input("Telefoonnummer")
+            submit = st.form_submit_button("Opslaan")
+        if submit and naam:
+            result = add_relation("transporters", {"naam": naam, "email": email, "telefoon": tel})
+            report_added_relation("transporters", "Transporteur", naam, result)
+
+        render_relation_list(
+            "transporters",
+            "Bestaande transporteurs",
+            lambda t: f"- **{t['naam']}** – {t.get('email','')} – {t.get('telefoon','')}",
+            "trans",
+        )
+
+    with col2:
+        st.subheader("Leveranciers")
+        with st.form("add_supplier"):
+            naam = st.text_input("Naam leverancier", key="sup_naam")
+            email = st.text_input("E-mailadres leverancier", key="sup_email")
+            tel = st.text_input("Telefoonnummer leverancier", key="sup_tel")
+            submit2 = st.form_submit_button("Opslaan", key="sup_submit")
+        if submit2 and naam:
+            result = add_relation("suppliers", {"naam": naam, "email": email, "telefoon": tel})
+            report_added_relation("suppliers", "Leverancier", naam, result)
+
+        render_relation_list(
+            "suppliers",
+            "Bestaande leveranciers",
+            lambda s: f"- **{s['naam']}** – {s.get('email','')} – {s.get('telefoon','')}",
+            "sup",
+        )
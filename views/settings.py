@@ -0,0 +1,48 @@
+import streamlit as st
+
+import timing
+
+
+def page_settings():
+    st.header("Instellingen & backup")
+
+    st.subheader("Backup maken")
+    if st.button("Genereer JSON-backup"):
+        data = {
+            "cars": st.session_state.cars,
+            "customers": st.session_state.customers,
+            "transporters": st.session_state.transporters,
+            "suppliers": st.session_state.suppliers,
+            "invoices": st.session_state.invoices,
+        }
+        st.session_state.backup_json = str(data)
+        st.download_button(
+            "Download backup.json",
+            data=st.session_state.backup_json,
+            file_name="land_automotive_backup.json",
+            mime="application/json",
+        )
+
+    st.subheader("Backup terugzetten")
+    uploaded = st.file_uploader("Upload eerder gedownloade backup.json", type=["json"], key="backup_file")
+    if uploaded and st.button("Backup inladen"):
+        try:
+            text = uploaded.read().decode("utf-8")
+            # ALLES is string -> eval is niet ideaal, maar voor intern gebruik kan dit;
+            # in productie beter json gebruiken met json.loads.
+            data = eval(text)
+            st.session_state.cars = data.get("cars", [])
+            st.session_state.customers = data.get("customers", [])
+            st.session_state.transporters = data.get("transporters", [])
+            st.session_state.suppliers = data.get("suppliers", [])
+            st.session_state.invoices = data.get("invoices", [])
+            st.success("Backup succesvol teruggezet.")
+        except Exception as e:
+            st.error(f"Kon backup niet inladen: {e}")
+
+    st.subheader("Opstarttijd (dit serverproces)")
+    if timing.TIMINGS:
+        for label, ms in timing.TIMINGS.items():
+            st.write(f"- {label}: {ms:,.0f} ms".replace(",", "."))
+    else:
+        st.write("Nog geen metingen.")